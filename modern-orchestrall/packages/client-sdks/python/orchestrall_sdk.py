@@ -5,26 +5,108 @@ Official Python client library for the Orchestrall Platform APIs.
 Provides both REST and MCP interfaces for seamless integration.
 """
 
-from typing import Dict, Any, Optional, List, Union
+from typing import TYPE_CHECKING, Callable, Dict, Any, FrozenSet, NamedTuple, Optional, List, Tuple, Union
+import copy
+import functools
+import itertools
 import json
+import re
+import sys
+import threading
 import time
 from dataclasses import dataclass
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-import websocket
 
+# requests/urllib3/websocket and the optional orjson/msgspec speedups are
+# imported where they are first used so that importing this module (e.g. for
+# its types) stays cheap
+if TYPE_CHECKING:
+    import requests
+    import websocket
 
-@dataclass
+
+@functools.lru_cache(maxsize=None)
+def _orjson() -> Any:
+    """Import orjson on first use; None when the optional speedup is not installed"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize a request body to JSON bytes.
+
+    Anything orjson cannot encode (e.g. integers wider than 64 bits) goes
+    through the stdlib encoder instead. Known difference: orjson encodes
+    NaN/Infinity as null, where the stdlib path rejects them.
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        try:
+            # Coerce non-str dict keys the way the stdlib json module does
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, allow_nan=False).encode('utf-8')
+
+
+def _loads(content: bytes) -> Any:
+    """
+    Deserialize a JSON response body.
+
+    Malformed bodies raise requests' JSONDecodeError, as response.json()
+    does. Known difference: orjson decodes integers wider than 64 bits as
+    floats, where the stdlib path keeps them exact.
+    """
+    orjson = _orjson()
+    try:
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+    except json.JSONDecodeError as e:
+        from requests.exceptions import JSONDecodeError
+        raise JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+# Request/response objects are created per call; use __slots__ where supported
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Consecutive failures (5xx or transport errors) before an endpoint's circuit opens, and for how long
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 10.0
+
+# Discovery cache key for MCP tools/list; REST discovery results are keyed by path
+_MCP_TOOLS_CACHE_KEY = 'mcp:tools/list'
+
+_VALID_AGENT_TYPES = frozenset({'crm', 'analytics', 'document', 'general'})
+_VALID_WORKFLOW_TYPES = frozenset({'customer-onboarding', 'document-processing', 'data-analysis'})
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class OrchestrallConfig:
     """Configuration for Orchestrall SDK"""
     base_url: str
     api_key: str
     timeout: int = 30
     retries: int = 3
-
-
-@dataclass
+    # POST endpoints (agent/workflow execution) are not idempotent, so they
+    # are only retried if explicitly added here
+    retry_methods: FrozenSet[str] = frozenset({'GET'})
+    pool_maxsize: int = 64
+    discovery_cache_ttl: float = 60.0
+
+    @property
+    def ws_url(self) -> str:
+        """
+        WebSocket base URL, derived from base_url on each access so it never
+        goes stale. Only the scheme changes: http -> ws, https -> wss.
+        """
+        return re.sub(r'^http', 'ws', self.base_url)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class AgentRequest:
     """Request structure for agent execution"""
     agent_type: str  # 'crm', 'analytics', 'document', 'general'
@@ -33,7 +115,7 @@ class AgentRequest:
     options: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AgentResponse:
     """Response structure from agent execution"""
     response: str
@@ -41,7 +123,7 @@ class AgentResponse:
     actions: Optional[List[Dict[str, Any]]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class WorkflowRequest:
     """Request structure for workflow execution"""
     workflow_type: str  # 'customer-onboarding', 'document-processing', 'data-analysis'
@@ -49,7 +131,7 @@ class WorkflowRequest:
     options: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class WorkflowResponse:
     """Response structure from workflow execution"""
     execution_id: str
@@ -58,7 +140,7 @@ class WorkflowResponse:
     metadata: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MCPRequest:
     """MCP (Model Context Protocol) request structure"""
     jsonrpc: str = "2.0"
@@ -67,7 +149,7 @@ class MCPRequest:
     params: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MCPResponse:
     """MCP response structure"""
     jsonrpc: str = "2.0"
@@ -76,6 +158,138 @@ class MCPResponse:
     error: Optional[Dict[str, Any]] = None
 
 
+class _MsgspecDecoders(NamedTuple):
+    """msgspec decoders for the typed response structs"""
+    envelope: Any
+    agent: Any
+    workflow: Any
+    mcp: Any
+    error: Any  # msgspec.DecodeError
+
+
+@functools.lru_cache(maxsize=None)
+def _msgspec_decoders() -> Optional[_MsgspecDecoders]:
+    """
+    Build the msgspec response structs and decoders on first use.
+
+    Typed structs let msgspec decode straight into objects, skipping the
+    intermediate dict built by a generic JSON parse. Returns None when the
+    optional msgspec speedup is not installed.
+    """
+    try:
+        import msgspec
+    except ImportError:
+        return None
+
+    class _Envelope(msgspec.Struct):
+        # data stays raw until success has been checked; an empty Raw means
+        # the key was absent (Optional[Raw] would only ever accept null)
+        success: Any = None
+        data: msgspec.Raw = msgspec.Raw()
+
+    class _AgentPayload(msgspec.Struct):
+        response: str
+        metadata: Optional[Dict[str, Any]]
+        actions: Optional[List[Dict[str, Any]]] = None
+
+    class _WorkflowPayload(msgspec.Struct, rename='camel'):
+        execution_id: str
+        status: str
+        result: Optional[Any] = None
+        metadata: Optional[Dict[str, Any]] = {}
+
+    # Unknown fields are rejected so such bodies take the dict path, where
+    # MCPResponse(**body) raises TypeError for them
+    class _MCPEnvelope(msgspec.Struct, forbid_unknown_fields=True):
+        jsonrpc: str = "2.0"
+        id: Union[str, int, None] = None
+        result: Optional[Any] = None
+        error: Optional[Dict[str, Any]] = None
+
+    return _MsgspecDecoders(
+        envelope=msgspec.json.Decoder(_Envelope),
+        agent=msgspec.json.Decoder(_AgentPayload),
+        workflow=msgspec.json.Decoder(_WorkflowPayload),
+        mcp=msgspec.json.Decoder(_MCPEnvelope),
+        error=msgspec.DecodeError,
+    )
+
+
+def _decode_payload(content: bytes, kind: str) -> Any:
+    """
+    Decode the data of a successful {success, data} response with msgspec.
+
+    Returns None when msgspec is unavailable, the call was unsuccessful, or
+    the body does not match the typed payload; callers then fall back to the
+    dict-based parse so errors are raised the same way either way.
+    """
+    decoders = _msgspec_decoders()
+    if decoders is None:
+        return None
+    try:
+        envelope = decoders.envelope.decode(content)
+        if not envelope.success or not envelope.data:
+            return None
+        return getattr(decoders, kind).decode(envelope.data)
+    except decoders.error:
+        return None
+
+
+def _parse_agent_response(content: bytes) -> AgentResponse:
+    """Parse a /v2/agents/execute response body"""
+    payload = _decode_payload(content, 'agent')
+    if payload is not None:
+        return AgentResponse(payload.response, payload.metadata, payload.actions)
+
+    result = _loads(content)
+    if not result.get('success'):
+        raise Exception(f"Agent execution failed: {result}")
+
+    data = result['data']
+    return AgentResponse(
+        response=data['response'],
+        metadata=data['metadata'],
+        actions=data.get('actions')
+    )
+
+
+def _parse_workflow_response(content: bytes) -> WorkflowResponse:
+    """Parse a /v2/workflows/execute response body"""
+    payload = _decode_payload(content, 'workflow')
+    if payload is not None:
+        return WorkflowResponse(payload.execution_id, payload.status,
+                                payload.result, payload.metadata)
+
+    result = _loads(content)
+    if not result.get('success'):
+        raise Exception(f"Workflow execution failed: {result}")
+
+    data = result['data']
+    return WorkflowResponse(
+        execution_id=data['executionId'],
+        status=data['status'],
+        result=data.get('result'),
+        metadata=data.get('metadata', {})
+    )
+
+
+def _parse_mcp_response(content: bytes) -> MCPResponse:
+    """Parse a /v2/mcp/execute response body"""
+    decoders = _msgspec_decoders()
+    if decoders is not None:
+        try:
+            envelope = decoders.mcp.decode(content)
+            return MCPResponse(envelope.jsonrpc, envelope.id, envelope.result, envelope.error)
+        except decoders.error:
+            pass  # Fall back to the dict path so errors match a plain install
+
+    return MCPResponse(**_loads(content))
+
+
+class CircuitOpenError(Exception):
+    """Raised without a network call while an endpoint's circuit breaker is open"""
+
+
 class OrchestrallSDK:
     """
     Main Orchestrall Platform SDK for Python clients.
@@ -88,16 +302,35 @@ class OrchestrallSDK:
         """Initialize the Orchestrall SDK"""
         self.config = config
         self.session = self._create_session()
+        # Bound once so _request does not re-run the import on every call
+        from requests import RequestException
+        self._request_errors = RequestException
+        self._discovery_cache: Dict[str, Tuple[float, Any]] = {}
+        self._breaker: Dict[str, float] = {}
+        self._failures: Dict[str, int] = {}
+        self._breaker_lock = threading.Lock()
+
+    def _create_session(self) -> 'requests.Session':
+        """Create configured requests session with retries and a pooled adapter"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
 
-    def _create_session(self) -> requests.Session:
-        """Create configured requests session with retries"""
         session = requests.Session()
         retry_strategy = Retry(
             total=self.config.retries,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=self.config.retry_methods,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # pool_maxsize caps keep-alive connections kept per host; raising it from
+        # urllib3's default of 10 lets concurrent callers reuse sockets
+        adapter = HTTPAdapter(
+            pool_maxsize=self.config.pool_maxsize,
+            max_retries=retry_strategy,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -108,11 +341,84 @@ class OrchestrallSDK:
 
         return session
 
+    def _request(self, method: str, path: str, **kwargs) -> 'requests.Response':
+        """Send a request, failing fast while the endpoint's circuit is open"""
+        self._check_circuit(path)
+
+        url = f"{self.config.base_url}{path}"
+        try:
+            response = self.session.request(method, url, timeout=self.config.timeout, **kwargs)
+        except self._request_errors:
+            self._record_failure(path)
+            raise
+
+        if response.status_code >= 500:
+            self._record_failure(path)
+        else:
+            self._record_success(path)
+
+        response.raise_for_status()
+        return response
+
+    def _check_circuit(self, path: str) -> None:
+        """Raise CircuitOpenError while path is cooling down; let one probe through after"""
+        with self._breaker_lock:
+            open_until = self._breaker.get(path)
+            if open_until is None:
+                return
+
+            now = time.monotonic()
+            if now < open_until:
+                raise CircuitOpenError(f"Circuit open for {path}, retry later")
+
+            # Half-open: this call probes the endpoint while other callers
+            # keep failing fast until it succeeds or re-opens the circuit
+            self._breaker[path] = now + _BREAKER_COOLDOWN
+
+    def _record_failure(self, path: str) -> None:
+        """Count a failed call, opening the endpoint's circuit at the threshold"""
+        with self._breaker_lock:
+            failures = self._failures.get(path, 0) + 1
+            self._failures[path] = failures
+            # The count is kept while open, so a failed probe re-opens at once
+            if failures >= _BREAKER_THRESHOLD:
+                self._breaker[path] = time.monotonic() + _BREAKER_COOLDOWN
+
+    def _record_success(self, path: str) -> None:
+        """Reset the failure count and close the endpoint's circuit"""
+        with self._breaker_lock:
+            self._failures.pop(path, None)
+            self._breaker.pop(path, None)
+
+    def _cached(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Return fetch()'s result, cached under key for discovery_cache_ttl seconds.
+
+        Callers get a deep copy, so mutating the result cannot affect the cache.
+        """
+        cached = self._discovery_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.config.discovery_cache_ttl:
+            return copy.deepcopy(cached[1])
+
+        value = fetch()
+        self._discovery_cache[key] = (time.monotonic(), value)
+        return copy.deepcopy(value)
+
+    def _get_discovery(self, path: str, key: str) -> Any:
+        """GET a discovery endpoint through the discovery cache"""
+        return self._cached(path, lambda: _loads(self._request('GET', path).content)[key])
+
+    def invalidate_discovery_cache(self) -> None:
+        """Drop all cached discovery results, including MCP tool lists"""
+        self._discovery_cache.clear()
+
     # ===== AGENT APIs =====
 
     def execute_agent(self, request: AgentRequest) -> AgentResponse:
         """Execute an AI agent"""
-        url = f"{self.config.base_url}/v2/agents/execute"
+        if request.agent_type not in _VALID_AGENT_TYPES:
+            raise ValueError(f"Unknown agent type: {request.agent_type!r}")
+
         data = {
             'agentType': request.agent_type,
             'input': request.input,
@@ -120,106 +426,63 @@ class OrchestrallSDK:
             'options': request.options or {},
         }
 
-        response = self.session.post(url, json=data, timeout=self.config.timeout)
-        response.raise_for_status()
-
-        result = response.json()
-        if not result.get('success'):
-            raise Exception(f"Agent execution failed: {result}")
-
-        data = result['data']
-        return AgentResponse(
-            response=data['response'],
-            metadata=data['metadata'],
-            actions=data.get('actions')
-        )
+        response = self._request('POST', '/v2/agents/execute', data=_dumps(data))
+        return _parse_agent_response(response.content)
 
     def get_available_agents(self) -> List[Dict[str, Any]]:
         """Get list of available agents"""
-        url = f"{self.config.base_url}/v2/agents"
-        response = self.session.get(url, timeout=self.config.timeout)
-        response.raise_for_status()
-
-        result = response.json()
-        return result['data']
+        return self._get_discovery('/v2/agents', 'data')
 
     # ===== WORKFLOW APIs =====
 
     def execute_workflow(self, request: WorkflowRequest) -> WorkflowResponse:
         """Execute a workflow"""
-        url = f"{self.config.base_url}/v2/workflows/execute"
+        if request.workflow_type not in _VALID_WORKFLOW_TYPES:
+            raise ValueError(f"Unknown workflow type: {request.workflow_type!r}")
+
         data = {
             'workflowType': request.workflow_type,
             'input': request.input,
             'options': request.options or {},
         }
 
-        response = self.session.post(url, json=data, timeout=self.config.timeout)
-        response.raise_for_status()
-
-        result = response.json()
-        if not result.get('success'):
-            raise Exception(f"Workflow execution failed: {result}")
-
-        data = result['data']
-        return WorkflowResponse(
-            execution_id=data['executionId'],
-            status=data['status'],
-            result=data.get('result'),
-            metadata=data.get('metadata', {})
-        )
+        response = self._request('POST', '/v2/workflows/execute', data=_dumps(data))
+        return _parse_workflow_response(response.content)
 
     def get_available_workflows(self) -> List[Dict[str, Any]]:
         """Get list of available workflows"""
-        url = f"{self.config.base_url}/v2/workflows"
-        response = self.session.get(url, timeout=self.config.timeout)
-        response.raise_for_status()
-
-        result = response.json()
-        return result['data']
+        return self._get_discovery('/v2/workflows', 'data')
 
     # ===== PLUGIN APIs =====
 
     def get_available_plugins(self) -> List[Dict[str, Any]]:
         """Get list of available plugins"""
-        url = f"{self.config.base_url}/v2/plugins"
-        response = self.session.get(url, timeout=self.config.timeout)
-        response.raise_for_status()
-
-        result = response.json()
-        return result['data']
+        return self._get_discovery('/v2/plugins', 'data')
 
     # ===== ANALYTICS APIs =====
 
     def get_platform_analytics(self, timeframe: str = '7d',
                               metrics: Optional[List[str]] = None) -> Dict[str, Any]:
         """Get platform analytics"""
-        url = f"{self.config.base_url}/v2/analytics/platform"
         params = {'timeframe': timeframe}
         if metrics:
             params['metrics'] = ','.join(metrics)
 
-        response = self.session.get(url, params=params, timeout=self.config.timeout)
-        response.raise_for_status()
-
-        result = response.json()
+        response = self._request('GET', '/v2/analytics/platform', params=params)
+        result = _loads(response.content)
         return result['data']
 
     # ===== HEALTH APIs =====
 
     def get_health(self) -> Dict[str, Any]:
         """Get platform health status"""
-        url = f"{self.config.base_url}/v2/health"
-        response = self.session.get(url, timeout=self.config.timeout)
-        response.raise_for_status()
-        return response.json()
+        response = self._request('GET', '/v2/health')
+        return _loads(response.content)
 
     # ===== MCP APIs =====
 
     def execute_mcp(self, request: MCPRequest) -> MCPResponse:
         """Execute MCP request"""
-        url = f"{self.config.base_url}/v2/mcp/execute"
-
         # Convert to dict for JSON serialization
         data = {
             'jsonrpc': request.jsonrpc,
@@ -228,22 +491,20 @@ class OrchestrallSDK:
             'params': request.params,
         }
 
-        response = self.session.post(url, json=data, timeout=self.config.timeout)
-        response.raise_for_status()
-        return MCPResponse(**response.json())
+        response = self._request('POST', '/v2/mcp/execute', data=_dumps(data))
+        return _parse_mcp_response(response.content)
 
     def get_mcp_capabilities(self) -> Dict[str, Any]:
         """Get MCP server capabilities"""
-        url = f"{self.config.base_url}/v2/mcp/discovery"
-        response = self.session.get(url, timeout=self.config.timeout)
-        response.raise_for_status()
-        return response.json()['result']
+        return self._get_discovery('/v2/mcp/discovery', 'result')
 
     # ===== WEBSOCKET APIs =====
 
-    def connect_websocket(self, event_handlers: Optional[Dict[str, Any]] = None) -> websocket.WebSocket:
+    def connect_websocket(self, event_handlers: Optional[Dict[str, Any]] = None) -> 'websocket.WebSocket':
         """Connect to real-time WebSocket updates"""
-        ws_url = self.config.base_url.replace('http', 'ws') + '/v2/events'
+        import websocket
+
+        ws_url = self.config.ws_url + '/v2/events'
 
         def on_message(ws, message):
             try:
@@ -338,11 +599,12 @@ class OrchestrallMCPClient:
     def __init__(self, sdk: OrchestrallSDK):
         """Initialize MCP client with SDK instance"""
         self.sdk = sdk
+        self._id_counter = itertools.count(1)
 
     def execute_tool(self, tool_name: str, params: Dict[str, Any]) -> Any:
         """Execute MCP tool"""
         request = MCPRequest(
-            id=str(int(time.time() * 1000)),
+            id=str(next(self._id_counter)),
             method='tools/call',
             params={
                 'name': tool_name,
@@ -358,9 +620,13 @@ class OrchestrallMCPClient:
         return response.result
 
     def get_available_tools(self) -> List[Dict[str, Any]]:
-        """Get list of available MCP tools"""
+        """Get list of available MCP tools, cached alongside the SDK's discovery results"""
+        return self.sdk._cached(_MCP_TOOLS_CACHE_KEY, self._fetch_tools)
+
+    def _fetch_tools(self) -> List[Dict[str, Any]]:
+        """Fetch the MCP tool list from the server"""
         request = MCPRequest(
-            id=str(int(time.time() * 1000)),
+            id=str(next(self._id_counter)),
             method='tools/list'
         )
 
@@ -371,6 +637,10 @@ class OrchestrallMCPClient:
 
         return response.result['tools']
 
+    def invalidate_tools_cache(self) -> None:
+        """Force the next get_available_tools call to refetch from the server"""
+        self.sdk._discovery_cache.pop(_MCP_TOOLS_CACHE_KEY, None)
+
     # ===== MCP CONVENIENCE METHODS =====
 
     def crm(self, input_text: str, context: Optional[Dict[str, Any]] = None) -> Any:
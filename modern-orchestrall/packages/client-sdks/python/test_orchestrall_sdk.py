@@ -0,0 +1,120 @@
+"""
+Tests for the Orchestrall Python SDK response parsing.
+
+msgspec is an optional speedup; responses must parse, and fail, the same
+way whether or not it is installed. Run with: python -m unittest
+"""
+
+import importlib.util
+import json
+import unittest
+from unittest import mock
+
+import orchestrall_sdk as sdk
+
+
+HAS_MSGSPEC = importlib.util.find_spec('msgspec') is not None
+
+AGENT_BODIES = [
+    {'success': True, 'data': {'response': 'r', 'metadata': {'a': 1}, 'actions': [{}]}},
+    {'success': True, 'data': {'response': 'r', 'metadata': {}}},
+    {'success': 1, 'data': {'response': 'r', 'metadata': {}}},
+    {'success': True, 'data': {'response': 5, 'metadata': None}},
+    {'success': True, 'data': {'response': 'r', 'metadata': {}, 'extra': 1}, 'extra': 1},
+    {'success': False, 'data': {'error': 'bad'}},
+    {'success': True, 'data': None},
+    {'success': True, 'data': {'response': 'r'}},
+    {'success': True},
+    {},
+    [],
+]
+
+WORKFLOW_BODIES = [
+    {'success': True, 'data': {'executionId': 'e', 'status': 's', 'result': [1], 'metadata': {'a': 1}}},
+    {'success': True, 'data': {'executionId': 'e', 'status': 's'}},
+    {'success': True, 'data': {'executionId': 'e', 'status': 's', 'metadata': None}},
+    {'success': True, 'data': {'executionId': 1, 'status': 's'}},
+    {'success': False, 'data': {'error': 'bad'}},
+    {'success': True, 'data': {'status': 's'}},
+    {'success': True},
+]
+
+MCP_BODIES = [
+    {'jsonrpc': '2.0', 'id': '1', 'result': {'tools': [{'name': 't'}]}},
+    {'jsonrpc': '2.0', 'id': 1, 'result': None},
+    {'jsonrpc': '2.0', 'id': None, 'error': {'message': 'm'}},
+    {'jsonrpc': '2.0', 'id': '1', 'error': 'boom'},
+    {'jsonrpc': '2.0', 'id': 1.5},
+    {'jsonrpc': '2.0', 'id': '1', 'result': {}, 'extra': 1},
+    {},
+    [],
+]
+
+
+def _outcome(parse, content):
+    """Return a comparable summary of what parse(content) returns or raises"""
+    try:
+        return ('ok', parse(content))
+    except Exception as e:  # the exception type and message are what must match
+        return (type(e), str(e))
+
+
+@unittest.skipUnless(HAS_MSGSPEC, 'msgspec is not installed')
+class MsgspecParityTest(unittest.TestCase):
+    """Responses parse identically with msgspec present and absent"""
+
+    def assert_parity(self, parse, bodies):
+        for body in bodies:
+            content = json.dumps(body).encode('utf-8')
+            with self.subTest(body=body):
+                with_msgspec = _outcome(parse, content)
+                with mock.patch.object(sdk, '_msgspec_decoders', return_value=None):
+                    without_msgspec = _outcome(parse, content)
+                self.assertEqual(with_msgspec, without_msgspec)
+
+    def test_agent_response(self):
+        self.assert_parity(sdk._parse_agent_response, AGENT_BODIES)
+
+    def test_workflow_response(self):
+        self.assert_parity(sdk._parse_workflow_response, WORKFLOW_BODIES)
+
+    def test_mcp_response(self):
+        self.assert_parity(sdk._parse_mcp_response, MCP_BODIES)
+
+    def test_msgspec_path_is_used_for_valid_bodies(self):
+        agent = json.dumps(AGENT_BODIES[0]).encode('utf-8')
+        workflow = json.dumps(WORKFLOW_BODIES[0]).encode('utf-8')
+        mcp = json.dumps(MCP_BODIES[0]).encode('utf-8')
+        self.assertIsNotNone(sdk._decode_payload(agent, 'agent'))
+        self.assertIsNotNone(sdk._decode_payload(workflow, 'workflow'))
+        sdk._msgspec_decoders().mcp.decode(mcp)
+
+
+class DictPathTest(unittest.TestCase):
+    """The fallback path used when msgspec is not installed"""
+
+    def setUp(self):
+        patcher = mock.patch.object(sdk, '_msgspec_decoders', return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_agent_response(self):
+        content = json.dumps(AGENT_BODIES[0]).encode('utf-8')
+        self.assertEqual(
+            sdk._parse_agent_response(content),
+            sdk.AgentResponse('r', {'a': 1}, [{}]),
+        )
+
+    def test_unsuccessful_agent_response_raises(self):
+        content = json.dumps({'success': False}).encode('utf-8')
+        with self.assertRaisesRegex(Exception, 'Agent execution failed'):
+            sdk._parse_agent_response(content)
+
+    def test_mcp_response_rejects_unknown_fields(self):
+        content = json.dumps(MCP_BODIES[5]).encode('utf-8')
+        with self.assertRaises(TypeError):
+            sdk._parse_mcp_response(content)
+
+
+if __name__ == '__main__':
+    unittest.main()